@@ -1,3 +1,3 @@
 from . import models
-from .hooks import post_init_activate_departments
+from .hooks import post_init_activate_departments, post_init_backfill_planning_resources
 from . import wizards
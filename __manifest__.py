@@ -11,7 +11,9 @@
         'views/planning_gantt_views.xml',
         'views/mrp_workcenter_views.xml',
         'views/mrp_production_views.xml',
+        'data/server_actions.xml',
     ],
+    'post_init_hook': 'post_init_backfill_planning_resources',
     'sequence': 10,
     'installable': True,
     'application': False, 
@@ -6,3 +6,10 @@ def post_init_activate_departments(cr, registry):
     # If there are zero active departments, unarchive all (idempotent & safe)
     if not env['hr.department'].search_count([('active', '=', True)]):
         Dept.search([('active', '=', False)]).write({'active': True})
+
+
+def post_init_backfill_planning_resources(cr, registry):
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    # Create every missing planning resource up front so slots don't pay for it
+    env['hr.department']._backfill_planning_resources()
+    env['mrp.workcenter']._backfill_planning_resources()
@@ -1,5 +1,5 @@
 # your_module/models/hr_department.py
-from odoo import models, fields
+from odoo import api, models, fields
 
 class HrDepartment(models.Model):
     _inherit = 'hr.department'
@@ -11,11 +11,22 @@ class HrDepartment(models.Model):
     shift_three_head_id = fields.Many2one('res.users', string='Shift 3 Supervisor')
 
     def action_create_planning_resource(self):
-        for dep in self:
-            if not dep.planning_resource_id:
-                dep.planning_resource_id = self.env['resource.resource'].create({
-                    'name': dep.name,
-                    'company_id': dep.company_id.id or False,
-                    'is_department': True,
-                    'department_id': dep.id,
-                })
+        self._create_planning_resources()
+
+    def _create_planning_resources(self):
+        """Create the missing planning resources with a single ``create``."""
+        missing = self.filtered(lambda dep: not dep.planning_resource_id)
+        if not missing:
+            return
+        resources = self.env['resource.resource'].create([{
+            'name': dep.name,
+            'company_id': dep.company_id.id or False,
+            'is_department': True,
+            'department_id': dep.id,
+        } for dep in missing])
+        for dep, resource in zip(missing, resources):
+            dep.planning_resource_id = resource
+
+    @api.model
+    def _backfill_planning_resources(self):
+        self.search([])._create_planning_resources()
@@ -1,5 +1,5 @@
 # your_module/models/mrp_workcenter.py
-from odoo import models, fields
+from odoo import api, models, fields
 
 class MrpWorkcenter(models.Model):
     _inherit = 'mrp.workcenter'
@@ -28,16 +28,46 @@ class MrpWorkcenter(models.Model):
         string="مقدار فرعی", 
     )
 
+    def write(self, vals):
+        res = super().write(vals)
+        if 'resource_calendar_id' in vals:
+            self.mapped('planning_resource_id').write({'calendar_id': vals['resource_calendar_id']})
+        return res
+
     def action_create_planning_resource(self):
-        for wc in self:
-            if not wc.planning_resource_id:
-                wc.planning_resource_id = self.env['resource.resource'].create({
-                    'name': wc.name,
-                    'company_id': wc.company_id.id or False,
-                    'is_workcenter': True,
-                    'workcenter_id': wc.id,
-                    'calendar_id': wc.resource_calendar_id.id,
-                })
-            else:
-                if wc.planning_resource_id.calendar_id != wc.resource_calendar_id:
-                    wc.planning_resource_id.calendar_id = wc.resource_calendar_id.id
+        self._create_planning_resources()
+        self._sync_planning_resource_calendars()
+
+    def _create_planning_resources(self):
+        """Create the missing planning resources with a single ``create``."""
+        missing = self.filtered(lambda wc: not wc.planning_resource_id)
+        if not missing:
+            return
+        resources = self.env['resource.resource'].create([{
+            'name': wc.name,
+            'company_id': wc.company_id.id or False,
+            'is_workcenter': True,
+            'workcenter_id': wc.id,
+            'calendar_id': wc.resource_calendar_id.id,
+        } for wc in missing])
+        for wc, resource in zip(missing, resources):
+            wc.planning_resource_id = resource
+
+    def _sync_planning_resource_calendars(self):
+        """Align planning resource calendars, one ``write`` per calendar."""
+        stale = self.filtered(
+            lambda wc: wc.planning_resource_id
+            and wc.planning_resource_id.calendar_id != wc.resource_calendar_id
+        )
+        resources_by_calendar = {}
+        for wc in stale:
+            resources_by_calendar.setdefault(wc.resource_calendar_id, self.env['resource.resource'])
+            resources_by_calendar[wc.resource_calendar_id] |= wc.planning_resource_id
+        for calendar, resources in resources_by_calendar.items():
+            resources.write({'calendar_id': calendar.id})
+
+    @api.model
+    def _backfill_planning_resources(self):
+        workcenters = self.search([])
+        workcenters._create_planning_resources()
+        workcenters._sync_planning_resource_calendars()
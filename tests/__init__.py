@@ -0,0 +1 @@
+from . import test_planning_resources
@@ -0,0 +1,64 @@
+from odoo.tests.common import TransactionCase
+
+
+class TestPlanningResources(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Resource = cls.env['resource.resource']
+        cls.calendar = cls.env['resource.calendar'].create({'name': 'Planning Test Calendar'})
+        cls.departments = cls.env['hr.department'].create([
+            {'name': 'Planning Dept A'},
+            {'name': 'Planning Dept B'},
+        ])
+        cls.workcenters = cls.env['mrp.workcenter'].create([
+            {'name': 'Planning WC A'},
+            {'name': 'Planning WC B'},
+        ])
+
+    def test_department_backfill_creates_one_resource_each(self):
+        self.env['hr.department']._backfill_planning_resources()
+        for dep in self.departments:
+            self.assertTrue(dep.planning_resource_id.is_department)
+            self.assertEqual(dep.planning_resource_id.department_id, dep)
+            self.assertEqual(self.Resource.search_count([('department_id', '=', dep.id)]), 1)
+
+    def test_workcenter_backfill_creates_one_resource_each(self):
+        self.env['mrp.workcenter']._backfill_planning_resources()
+        for wc in self.workcenters:
+            self.assertTrue(wc.planning_resource_id.is_workcenter)
+            self.assertEqual(wc.planning_resource_id.workcenter_id, wc)
+            self.assertEqual(wc.planning_resource_id.calendar_id, wc.resource_calendar_id)
+            self.assertEqual(self.Resource.search_count([('workcenter_id', '=', wc.id)]), 1)
+
+    def test_backfill_is_idempotent(self):
+        self.env['hr.department']._backfill_planning_resources()
+        self.env['mrp.workcenter']._backfill_planning_resources()
+        dep_resources = self.departments.mapped('planning_resource_id')
+        wc_resources = self.workcenters.mapped('planning_resource_id')
+        count = self.Resource.search_count([])
+
+        self.env['hr.department']._backfill_planning_resources()
+        self.env['mrp.workcenter']._backfill_planning_resources()
+        self.assertEqual(self.departments.mapped('planning_resource_id'), dep_resources)
+        self.assertEqual(self.workcenters.mapped('planning_resource_id'), wc_resources)
+        self.assertEqual(self.Resource.search_count([]), count)
+
+    def test_backfill_skips_archived_records(self):
+        archived = self.env['hr.department'].create({'name': 'Planning Dept Archived', 'active': False})
+        self.env['hr.department']._backfill_planning_resources()
+        self.assertFalse(archived.planning_resource_id)
+
+    def test_workcenter_calendar_write_syncs_planning_resource(self):
+        self.workcenters._create_planning_resources()
+        self.workcenters.write({'resource_calendar_id': self.calendar.id})
+        for wc in self.workcenters:
+            self.assertEqual(wc.planning_resource_id.calendar_id, self.calendar)
+
+    def test_sync_fixes_drifted_calendars(self):
+        self.workcenters._create_planning_resources()
+        self.workcenters.mapped('planning_resource_id').write({'calendar_id': self.calendar.id})
+        self.workcenters._sync_planning_resource_calendars()
+        for wc in self.workcenters:
+            self.assertEqual(wc.planning_resource_id.calendar_id, wc.resource_calendar_id)